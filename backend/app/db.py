@@ -1,6 +1,7 @@
 import datetime as dt
 from pathlib import Path
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Index, column, or_, select, table, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -30,6 +31,11 @@ class Base(DeclarativeBase):
 # Evaluation モデル定義
 class Evaluation(Base):
     __tablename__ = "evaluations"
+    __table_args__ = (
+        # 一覧 API のキーセットページング (created_at, id) と絞り込み用
+        Index("ix_evaluations_created_at_id", "created_at", "id"),
+        Index("ix_evaluations_score", "score"),
+    )
 
     id:         Mapped[int]         = mapped_column(primary_key=True)
     question:   Mapped[str]         = mapped_column(nullable=False)
@@ -42,6 +48,60 @@ class Evaluation(Base):
         nullable=False,
     )
 
+# 全文検索 (FTS5) 用の外部コンテンツテーブル
+# 日本語は単語分割できないため trigram トークナイザで部分一致検索する
+FTS_TABLE = "evaluations_fts"
+FTS_CREATE = f"""
+CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+    question, answer, reason,
+    content='evaluations', content_rowid='id', tokenize='trigram'
+)
+"""
+FTS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON evaluations BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, question, answer, reason)
+        VALUES (new.id, new.question, new.answer, new.reason);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON evaluations BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, answer, reason)
+        VALUES ('delete', old.id, old.question, old.answer, old.reason);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON evaluations BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, answer, reason)
+        VALUES ('delete', old.id, old.question, old.answer, old.reason);
+        INSERT INTO {FTS_TABLE}(rowid, question, answer, reason)
+        VALUES (new.id, new.question, new.answer, new.reason);
+    END
+    """,
+]
+# trigram は 3 文字未満のクエリにマッチしない
+FTS_MIN_QUERY_LENGTH = 3
+
+evaluations_fts = table(FTS_TABLE, column("rowid"), column(FTS_TABLE))
+fts_enabled = False
+
+def text_search_clause(query: str):
+    """
+    質問・回答・理由のいずれかに query を含む評価を絞り込む条件を返す。
+    FTS5 が使えない場合や短いクエリは LIKE による走査にフォールバック
+    """
+    if fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+        phrase = '"' + query.replace('"', '""') + '"'
+        return Evaluation.id.in_(
+            select(evaluations_fts.c.rowid)
+            .where(evaluations_fts.c[FTS_TABLE].match(phrase))
+        )
+    return or_(
+        Evaluation.question.contains(query, autoescape=True),
+        Evaluation.answer.contains(query, autoescape=True),
+        Evaluation.reason.contains(query, autoescape=True),
+    )
+
 # セッション取得用の依存関数
 async def get_session() -> AsyncSession:
     """
@@ -55,5 +115,29 @@ async def init_db() -> None:
     """
     アプリ起動時などに呼び出してテーブルを作成
     """
+    global fts_enabled
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # 既存 DB ではテーブル作成がスキップされ、後から追加したインデックスも作られないため個別に作成
+        for index in Evaluation.__table__.indexes:
+            await conn.run_sync(index.create, checkfirst=True)
+        fts_enabled = await _init_fts(conn)
+
+async def _init_fts(conn) -> bool:
+    """
+    全文検索用テーブルと同期トリガーを作成。FTS5 が使えない SQLite では False を返す
+    """
+    exists = await conn.scalar(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    )
+    if not exists:
+        try:
+            await conn.execute(text(FTS_CREATE))
+        except OperationalError:
+            return False
+        # 既存の評価データを索引に取り込む
+        await conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    for ddl in FTS_TRIGGERS:
+        await conn.execute(text(ddl))
+    return True
@@ -1,17 +1,20 @@
 """FastAPI entry point for the LangGraph-based chatbot.
-This module exposes two endpoints:
-- GET /           → ヘルスチェック
-- GET /query/{q}  → チャットボット応答
+This module exposes the following endpoints (抜粋):
+- GET /                  → ヘルスチェック
+- GET /query/{q}         → チャットボット応答
+- GET /evaluations       → 評価データの絞り込み・ページング取得
+- GET /evaluations/{id}  → 評価データ 1 件の取得
 """
+import datetime as dt
 import shutil
 from pathlib import Path
 from pydantic import BaseModel
-from fastapi import FastAPI, HTTPException, Depends,UploadFile, File
+from fastapi import FastAPI, HTTPException, Depends,UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from fastapi.responses import StreamingResponse, Response, JSONResponse
-from sqlalchemy import select, func, text
+from sqlalchemy import select, func, text, and_, or_
 import pandas as pd
 import io
 import matplotlib.pyplot as plt
@@ -21,7 +24,7 @@ from .chat_bot import create_response
 from .answer_rag import iterate_rag
 from .hint_rag import create_hint_rag
 from .evaluator import evaluate_answer
-from .db import Evaluation, get_session, init_db
+from .db import Evaluation, get_session, init_db, text_search_clause
 
 app = FastAPI()
 app.add_middleware(
@@ -141,6 +144,128 @@ async def export_evaluations(
     }
     return StreamingResponse(buf, media_type="text/csv", headers=headers)
 
+# --- 評価データの一覧 (管理画面用) ---
+EVALUATION_FIELDS = {
+    "id": Evaluation.id,
+    "question": Evaluation.question,
+    "answer": Evaluation.answer,
+    "score": Evaluation.score,
+    "reason": Evaluation.reason,
+    "created_at": Evaluation.created_at,
+}
+# 一覧表示では長い回答本文を返さない
+DEFAULT_EVALUATION_FIELDS = "id,question,score,reason,created_at"
+
+
+def _encode_cursor(created_at: dt.datetime, evaluation_id: int) -> str:
+    return f"{created_at.isoformat()}_{evaluation_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[dt.datetime, int]:
+    try:
+        created_at, evaluation_id = cursor.rsplit("_", 1)
+        return dt.datetime.fromisoformat(created_at), int(evaluation_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="cursor の形式が不正です。")
+
+
+def _serialize_evaluation(row) -> dict:
+    record = dict(row._mapping)
+    if "created_at" in record:
+        record["created_at"] = record["created_at"].isoformat()
+    return record
+
+
+@app.get("/evaluations")
+async def list_evaluations(
+    start:     Optional[str] = None,
+    end:       Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    q:         Optional[str] = None,
+    fields:    str = DEFAULT_EVALUATION_FIELDS,
+    cursor:    Optional[str] = None,
+    limit:     int = Query(50, ge=1, le=200),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    評価データを新しい順にページング取得。
+    ・start, end は ISO8601 形式の日付文字列 (end は含まない)
+    ・min_score, max_score でスコア範囲、q で質問・回答・理由を部分一致検索
+    ・fields はカンマ区切りの返却項目 (id, created_at は常に含む)
+    ・cursor には前ページの next_cursor を渡す
+    ・summary は絞り込み条件全体 (ページング前) の集計値
+    """
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EVALUATION_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"不明な項目です: {', '.join(unknown)}",
+        )
+    names = ["id", "created_at"] + [n for n in names if n not in ("id", "created_at")]
+
+    conditions = []
+    if start:
+        conditions.append(Evaluation.created_at >= start)
+    if end:
+        conditions.append(Evaluation.created_at < end)
+    if min_score is not None:
+        conditions.append(Evaluation.score >= min_score)
+    if max_score is not None:
+        conditions.append(Evaluation.score <= max_score)
+    if q and q.strip():
+        conditions.append(text_search_clause(q.strip()))
+
+    # 1) 絞り込み条件全体の集計
+    summary_q = select(
+        func.count(Evaluation.id).label("count"),
+        func.avg(Evaluation.score).label("avg_score"),
+        func.min(Evaluation.score).label("min_score"),
+        func.max(Evaluation.score).label("max_score"),
+    ).where(*conditions)
+    summary = (await session.execute(summary_q)).one()._asdict()
+
+    # 2) (created_at, id) のキーセットで次ページを取得
+    page_q = select(*(EVALUATION_FIELDS[name] for name in names)).where(*conditions)
+    if cursor:
+        cursor_at, cursor_id = _decode_cursor(cursor)
+        page_q = page_q.where(
+            Evaluation.created_at <= cursor_at,
+            or_(
+                Evaluation.created_at < cursor_at,
+                and_(Evaluation.created_at == cursor_at, Evaluation.id < cursor_id),
+            ),
+        )
+    page_q = page_q.order_by(
+        Evaluation.created_at.desc(), Evaluation.id.desc()
+    ).limit(limit + 1)
+    rows = (await session.execute(page_q)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return {
+        "items": [_serialize_evaluation(row) for row in rows],
+        "next_cursor": next_cursor,
+        "summary": summary,
+    }
+
+
+@app.get("/evaluations/{evaluation_id}")
+async def get_evaluation(
+    evaluation_id: int,
+    session: AsyncSession = Depends(get_session),
+):
+    """評価データを 1 件取得 (回答本文を含む)"""
+    q = select(*EVALUATION_FIELDS.values()).where(Evaluation.id == evaluation_id)
+    row = (await session.execute(q)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="評価データが見つかりません。")
+    return _serialize_evaluation(row)
+
 @app.get("/metrics/quality/daily.png")
 async def daily_quality_from_db(session: AsyncSession = Depends(get_session)):
     # 1) DB から集計
@@ -0,0 +1,82 @@
+import asyncio
+import datetime as dt
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from app.main import app
+from app.db import Base, Evaluation, get_session
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'eval.db'}")
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_maker() as session:
+            base = dt.datetime(2025, 5, 1, 9, 0)
+            session.add_all([
+                Evaluation(
+                    question=f"質問{i}",
+                    answer="RAG の回答" if i % 2 else "通常の回答",
+                    score=i,
+                    reason=None,
+                    created_at=base + dt.timedelta(days=i // 2),
+                )
+                for i in range(1, 7)
+            ])
+            await session.commit()
+
+    async def override_get_session():
+        async with session_maker() as session:
+            yield session
+
+    asyncio.run(setup())
+    app.dependency_overrides[get_session] = override_get_session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    asyncio.run(engine.dispose())
+
+
+def test_list_evaluations_pages_with_cursor(client):
+    ids = []
+    cursor = None
+    while True:
+        params = {"limit": 4}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/evaluations", params=params).json()
+        ids += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    # created_at が同じ行も含め、新しい順に重複なく取得できる
+    assert ids == [6, 5, 4, 3, 2, 1]
+
+
+def test_list_evaluations_filters_and_summary(client):
+    res = client.get(
+        "/evaluations",
+        params={"min_score": 2, "max_score": 5, "q": "RAG", "start": "2025-05-02"},
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert [item["id"] for item in body["items"]] == [5, 3]
+    assert "answer" not in body["items"][0]
+    assert body["summary"] == {"count": 2, "avg_score": 4.0, "min_score": 3, "max_score": 5}
+
+
+def test_list_evaluations_rejects_unknown_field(client):
+    res = client.get("/evaluations", params={"fields": "question,password"})
+    assert res.status_code == 400
+
+
+def test_get_evaluation(client):
+    res = client.get("/evaluations/1")
+    assert res.status_code == 200
+    assert res.json()["answer"] == "RAG の回答"
+    assert client.get("/evaluations/999").status_code == 404
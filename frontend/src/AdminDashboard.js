@@ -9,25 +9,47 @@ function AdminDashboard() {
     const [loading, setLoading] = useState(false);
     const [error, setError] = useState(null);
     const [file, setFile] = useState(null);
+    const [minScore, setMinScore] = useState("");
+    const [maxScore, setMaxScore] = useState("");
+    const [keyword, setKeyword] = useState("");
+    const [nextCursor, setNextCursor] = useState(null);
+    const [summary, setSummary] = useState(null);
+    const [answers, setAnswers] = useState({});
 
     const API_BASE = "https://fuzzy-invention-x6qvq5qqg6pfvrgv-8000.app.github.dev";
+    const PAGE_SIZE = 50;
 
-    const fetchEvaluations = async () => {
+    const buildQueryParams = () => {
+        const params = new URLSearchParams();
+        if (startDate) params.append("start", startDate);
+        if (endDate) {
+            // 終了日を1日進める
+            const nextDay = new Date(endDate);
+            nextDay.setDate(nextDay.getDate() + 1);
+            const nextDayStr = nextDay.toISOString().slice(0, 10);
+            params.append("end", nextDayStr);
+        }
+        if (minScore !== "") params.append("min_score", minScore);
+        if (maxScore !== "") params.append("max_score", maxScore);
+        if (keyword.trim()) params.append("q", keyword.trim());
+        return params;
+    };
+
+    // cursor を渡すと続きのページを既存の一覧に追加する
+    const fetchEvaluations = async (cursor = null) => {
         setLoading(true);
         setError(null);
         try {
-            const params = new URLSearchParams({ fmt: "json" });
-            if (startDate) params.append("start", startDate);
-            if (endDate) {
-                // 終了日を1日進める
-                const nextDay = new Date(endDate);
-                nextDay.setDate(nextDay.getDate() + 1);
-                const nextDayStr = nextDay.toISOString().slice(0, 10);
-                params.append("end", nextDayStr);
-            }
-            const res = await fetch(`${API_BASE}/export/evaluations?${params.toString()}`);
+            const params = buildQueryParams();
+            params.append("limit", PAGE_SIZE);
+            if (cursor) params.append("cursor", cursor);
+            const res = await fetch(`${API_BASE}/evaluations?${params.toString()}`);
+            if (!res.ok) throw new Error(res.statusText);
             const json = await res.json();
-            setData(json);
+            setData((prev) => (cursor ? [...prev, ...json.items] : json.items));
+            setNextCursor(json.next_cursor);
+            setSummary(json.summary);
+            if (!cursor) setAnswers({});
         } catch (err) {
             setError("読み込みに失敗しました");
         } finally {
@@ -35,6 +57,18 @@ function AdminDashboard() {
         }
     };
 
+    // 一覧では回答本文を取得しないため、必要な行だけ個別に取得
+    const fetchAnswer = async (id) => {
+        try {
+            const res = await fetch(`${API_BASE}/evaluations/${id}`);
+            if (!res.ok) throw new Error(res.statusText);
+            const json = await res.json();
+            setAnswers((prev) => ({ ...prev, [id]: json.answer }));
+        } catch (err) {
+            alert("回答の取得に失敗しました");
+        }
+    };
+
     const downloadCSV = () => {
         const params = new URLSearchParams({ fmt: "csv" });
         if (startDate) params.append("start", startDate);
@@ -91,8 +125,33 @@ function AdminDashboard() {
                     onChange={(e) => setEndDate(e.target.value)}
                     style={{ border: "1px solid #ccc", padding: "4px 8px" }}
                 />
+                <input
+                    type="number"
+                    min={0}
+                    max={10}
+                    placeholder="最小スコア"
+                    value={minScore}
+                    onChange={(e) => setMinScore(e.target.value)}
+                    style={{ border: "1px solid #ccc", padding: "4px 8px", width: 96 }}
+                />
+                <input
+                    type="number"
+                    min={0}
+                    max={10}
+                    placeholder="最大スコア"
+                    value={maxScore}
+                    onChange={(e) => setMaxScore(e.target.value)}
+                    style={{ border: "1px solid #ccc", padding: "4px 8px", width: 96 }}
+                />
+                <input
+                    type="text"
+                    placeholder="キーワード"
+                    value={keyword}
+                    onChange={(e) => setKeyword(e.target.value)}
+                    style={{ border: "1px solid #ccc", padding: "4px 8px" }}
+                />
                 <button
-                    onClick={fetchEvaluations}
+                    onClick={() => fetchEvaluations()}
                     style={{
                         background: "#2563eb",
                         color: "#fff",
@@ -138,9 +197,15 @@ function AdminDashboard() {
                 </button>
             </div>
 
-            {loading ? (
-                <p>読み込み中...</p>
-            ) : error ? (
+            {summary && (
+                <p style={{ marginBottom: 8 }}>
+                    件数: {summary.count} / 平均スコア:{" "}
+                    {summary.avg_score != null ? summary.avg_score.toFixed(2) : "-"} / 最小: {summary.min_score ?? "-"} / 最大:{" "}
+                    {summary.max_score ?? "-"}
+                </p>
+            )}
+
+            {error ? (
                 <p style={{ color: "#dc2626" }}>{error}</p>
             ) : (
                 <table style={{ width: "100%", fontSize: 14, borderCollapse: "collapse", border: "1px solid #ccc" }}>
@@ -157,12 +222,29 @@ function AdminDashboard() {
                         {data.map((row, idx) => {
                             const jstDate = toZonedTime(new Date(row.created_at), "Asia/Tokyo");
                             return (
-                                <tr key={idx} style={{ background: idx % 2 === 0 ? "#fff" : "#f9fafb" }}>
+                                <tr key={row.id} style={{ background: idx % 2 === 0 ? "#fff" : "#f9fafb" }}>
                                     <td style={{ border: "1px solid #ccc", padding: "4px 8px" }}>
                                         {format(jstDate, "yyyy-MM-dd HH:mm")}
                                     </td>
                                     <td style={{ border: "1px solid #ccc", padding: "4px 8px" }}>{row.question}</td>
-                                    <td style={{ border: "1px solid #ccc", padding: "4px 8px" }}>{row.answer}</td>
+                                    <td style={{ border: "1px solid #ccc", padding: "4px 8px" }}>
+                                        {row.id in answers ? (
+                                            answers[row.id]
+                                        ) : (
+                                            <button
+                                                onClick={() => fetchAnswer(row.id)}
+                                                style={{
+                                                    background: "none",
+                                                    color: "#2563eb",
+                                                    border: "none",
+                                                    cursor: "pointer",
+                                                    padding: 0,
+                                                }}
+                                            >
+                                                回答を表示
+                                            </button>
+                                        )}
+                                    </td>
                                     <td style={{ border: "1px solid #ccc", padding: "4px 8px", textAlign: "center" }}>{row.score}</td>
                                     <td style={{ border: "1px solid #ccc", padding: "4px 8px" }}>{row.reason}</td>
                                 </tr>
@@ -172,6 +254,27 @@ function AdminDashboard() {
                 </table>
             )}
 
+            {loading ? (
+                <p>読み込み中...</p>
+            ) : (
+                nextCursor && (
+                    <button
+                        onClick={() => fetchEvaluations(nextCursor)}
+                        style={{
+                            marginTop: 8,
+                            background: "#2563eb",
+                            color: "#fff",
+                            padding: "4px 16px",
+                            borderRadius: 4,
+                            border: "none",
+                            cursor: "pointer",
+                        }}
+                    >
+                        さらに読み込む
+                    </button>
+                )
+            )}
+
             <div style={{ marginTop: 32 }}>
                 <h2 style={{ fontSize: 18, fontWeight: "bold", marginBottom: 8 }}>スコア推移グラフ</h2>
                 <img